@@ -1,35 +1,34 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import sys
-from typing import Generator
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
 
 from omega_moderne_client.campaign.campaign import Campaign
 
-from croniter import croniter
-from datetime import datetime
-import pytz
+# Monday, Wednesday, Thursday, Friday; must match the schedule of the `weekday-campaign` workflow
+SCHEDULED_WEEKDAYS = frozenset({0, 2, 3, 4})
+BASE_DATE = date(2023, 1, 1)
 
 
-def cron_iterate(cron: croniter) -> Generator[datetime, None, None]:
-    while True:
-        yield cron.get_next(datetime)
+def count_scheduled_days(start: date, end: date) -> int:
+    """Count the scheduled days strictly after `start` and strictly before `end`."""
+    days = (end - start).days - 1
+    if days <= 0:
+        return 0
+    full_weeks, remainder = divmod(days, 7)
+    first_weekday = (start.weekday() + 1) % 7
+    return full_weeks * len(SCHEDULED_WEEKDAYS) + \
+        sum(1 for day in range(remainder) if (first_weekday + day) % 7 in SCHEDULED_WEEKDAYS)
 
 
 def main():
-    timezone = pytz.timezone('EST5EDT')
-    today = datetime.now(timezone)
-    campaigns = sorted(Campaign.load_all(), key=lambda c: c.name)
-
-    base = datetime(2023, 1, 1, tzinfo=timezone)
-    it = croniter('0 0 * * Mon,Wed,Thu,Fri', base)
-
-    for i, t in enumerate(cron_iterate(it)):
-        if t.month == today.month and t.day == today.day and t.year == today.year:
-            print(campaigns[i % len(campaigns)].name)
-            break
-        if t > today:
-            print('could not compute next campaign')
-            sys.exit(1)
+    today = datetime.now(ZoneInfo('EST5EDT')).date()
+    if today.weekday() not in SCHEDULED_WEEKDAYS:
+        print('could not compute next campaign')
+        sys.exit(1)
+    campaigns = sorted(Campaign.list_campaigns())
+    print(campaigns[count_scheduled_days(BASE_DATE, today) % len(campaigns)])
 
 
 if __name__ == '__main__':
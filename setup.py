@@ -30,9 +30,9 @@ setup(
             "rich-argparse>=1.0.0",
             "isodate>=0.6.1",
         ],
-        "github-scripts": [
-            "croniter>=1.3.8",
-            "pytz>=2022",
+        "speedups": [
+            "orjson>=3.8.0",
+            "pybase64>=1.2.3",
         ],
         "test": [
             "pytest>=6",
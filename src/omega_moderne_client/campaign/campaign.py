@@ -1,4 +1,6 @@
 import base64
+import functools
+import os
 import re
 from dataclasses import dataclass
 from importlib.abc import Traversable
@@ -9,6 +11,39 @@ from uuid import UUID
 import yaml
 from liquid import Template
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    from pybase64 import b64encode_as_string  # pytype: disable=import-error
+except ImportError:
+    def b64encode_as_string(s: bytes) -> str:
+        return base64.b64encode(s).decode('ascii')
+
+
+# language=yaml
+_RECIPE_YAML_NAME_TEMPLATE = """\
+type: specs.openrewrite.org/v1beta/recipe
+name: 'org.openssf.research.SecurityFixRecipe (Alpha Omega Identifier: %(uuid)s)'
+"""
+
+# language=yaml
+_RECIPE_YAML_BODY_TEMPLATE = """\
+displayName: Apply `%(recipe_id)s`
+description: >
+ Applies the `%(recipe_id)s` to non-test sources first, if changes are made, then apply to all sources.
+tags:
+    - security
+applicability:
+  anySource:
+    - org.openrewrite.java.search.IsLikelyNotTest
+    - %(recipe_id)s
+recipeList:
+  - %(recipe_id)s
+"""
+
 
 @dataclass(frozen=True)
 class Campaign:
@@ -26,25 +61,23 @@ class Campaign:
     pr_body: str
 
     def get_recipe_yaml(self, uuid: UUID) -> str:
-        # language=yaml
-        return f"""\
-        type: specs.openrewrite.org/v1beta/recipe
-        name: 'org.openssf.research.SecurityFixRecipe (Alpha Omega Identifier: {uuid})'
-        displayName: Apply `{self.recipe_id}`
-        description: >
-         Applies the `{self.recipe_id}` to non-test sources first, if changes are made, then apply to all sources.
-        tags:
-            - security
-        applicability:
-          anySource:
-            - org.openrewrite.java.search.IsLikelyNotTest
-            - {self.recipe_id}
-        recipeList:
-          - {self.recipe_id}
-        """
+        return _RECIPE_YAML_NAME_TEMPLATE % {"uuid": uuid} + self._recipe_yaml_body
+
+    @functools.cached_property
+    def _recipe_yaml_body(self) -> str:
+        """Everything in the recipe YAML after its name, which is the only part that differs between runs."""
+        return _RECIPE_YAML_BODY_TEMPLATE % {"recipe_id": self.recipe_id}
 
     def get_recipe_yaml_base_64(self, uuid: UUID) -> str:
-        return base64.b64encode(self.get_recipe_yaml(uuid).encode('utf-8')).decode('utf-8')
+        return b64encode_as_string(self.get_recipe_yaml(uuid).encode('utf-8'))
+
+    @functools.cached_property
+    def commit_extended_base_64(self) -> str:
+        return b64encode_as_string(self.commit_extended.encode('utf-8'))
+
+    @functools.cached_property
+    def pr_body_base_64(self) -> str:
+        return b64encode_as_string(self.pr_body.encode('utf-8'))
 
     @classmethod
     def load(cls, name: str) -> 'Campaign':
@@ -52,7 +85,7 @@ class Campaign:
 
     @classmethod
     def _load(cls, campaign_globals: 'CampaignGlobals', name: str) -> 'Campaign':
-        campaign_yaml = yaml.safe_load(cls._load_file_contents(name, "campaign.yaml"))
+        campaign_yaml = yaml.load(cls._load_file_contents(name, "campaign.yaml"), Loader=SafeLoader)
         recipe_id = campaign_yaml['recipe']['id']
         branch = campaign_yaml['branch_name']
         commit_title, commit_extended = cls._load_file_contents_as_title_and_body(name, "commit.txt")
@@ -76,28 +109,26 @@ class Campaign:
 
     @classmethod
     def list_campaigns(cls) -> List[str]:
-        return [file.name for file in _campaigns_dir().iterdir() if file.is_dir()]
-
-    @classmethod
-    def _load_campaign_resource(cls, campaign: str, path: str) -> Traversable:
-        resource = _campaigns_dir().joinpath(campaign).joinpath(path)
-        if not resource.is_file():
-            raise ValueError(f"File {path} does not exist, and must to create a campaign")
-        return resource
+        campaigns_dir = _campaigns_dir()
+        if isinstance(campaigns_dir, os.PathLike):
+            # Installed on the file system, the type of each entry comes with the directory listing
+            with os.scandir(campaigns_dir) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        return [file.name for file in campaigns_dir.iterdir() if file.is_dir()]
 
     @classmethod
     def _load_file_contents(cls, campaign: str, path: str) -> str:
-        resource = cls._load_campaign_resource(campaign, path)
-        # noinspection PyTypeChecker
-        with open(resource, 'r', encoding='utf-8') as file:  # pytype: disable=wrong-arg-types
-            return file.read()
+        try:
+            return _campaigns_dir().joinpath(campaign).joinpath(path).read_text(encoding='utf-8')
+        except (FileNotFoundError, IsADirectoryError) as error:
+            raise ValueError(f"File {path} does not exist, and must to create a campaign") from error
 
     @classmethod
     def _load_file_contents_as_title_and_body(cls, campaign: str, path: str) -> Tuple[str, str]:
-        resource = cls._load_campaign_resource(campaign, path)
-        # noinspection PyTypeChecker
-        with open(resource, 'r', encoding='utf-8') as file:  # pytype: disable=wrong-arg-types
-            return file.readline(), file.read().strip() + '\n'
+        contents = cls._load_file_contents(campaign, path)
+        # The title keeps its line ending, as it did when read with `readline`
+        title, line_ending, body = contents.partition('\n')
+        return title + line_ending, body.strip() + '\n'
 
 
 @dataclass(frozen=True)
@@ -116,7 +147,9 @@ class CampaignGlobals:
             self.pr_message_footer_bottom.render(campaign_yaml)
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def load(cls) -> 'CampaignGlobals':
+        """Load the globals shared by all campaigns. They are packaged with the campaigns, so only loaded once."""
         return cls(
             commit_footer=cls._load_file_contents_as_template("commit_footer.txt.liquid"),
             pr_message_footer_top=cls._load_file_contents_as_template("pr_message_footer_top.md.liquid"),
@@ -130,11 +163,10 @@ class CampaignGlobals:
 
     @classmethod
     def _load_file_contents(cls, path: str) -> str:
-        resource = _campaigns_dir().joinpath(path)
-        # noinspection PyTypeChecker
-        with open(resource, 'r', encoding='utf-8') as file:  # pytype: disable=wrong-arg-types
-            return re.sub(r'^<!-- vim:.*\n', '', file.read(), flags=re.MULTILINE)
+        contents = _campaigns_dir().joinpath(path).read_text(encoding='utf-8')
+        return re.sub(r'^<!-- vim:.*\n', '', contents, flags=re.MULTILINE)
 
 
+@functools.lru_cache(maxsize=1)
 def _campaigns_dir() -> Traversable:
     return files('omega_moderne_client.campaign').joinpath('campaigns')
@@ -8,6 +8,17 @@ from ..client.client_types import RecipeRunSummary, Repository, RepositoryInput
 from ..client.gpg_key_config import GpgKeyConfig
 from ..client.moderne_client import ModerneClient
 
+# Polling starts quickly so short runs are picked up promptly, then backs off while the state stays the same
+_POLL_INITIAL_DELAY = 1.0
+_POLL_MAX_DELAY = 30.0
+_POLL_BACKOFF_FACTOR = 1.5
+
+
+def _next_poll_delay(delay: float, state_changed: bool = False) -> float:
+    if state_changed:
+        return _POLL_INITIAL_DELAY
+    return min(delay * _POLL_BACKOFF_FACTOR, _POLL_MAX_DELAY)
+
 
 @dataclass(frozen=True)
 class CampaignExecutor:
@@ -32,6 +43,8 @@ class CampaignExecutor:
 
     async def await_recipe(self, run_id: str) -> 'RecipeExecutionResult':
         previous = {}
+        previous_state = ""
+        delay = _POLL_INITIAL_DELAY
         while True:
             status = await self.client.query_recipe_run_status(run_id)
             state = status["state"]
@@ -43,7 +56,9 @@ class CampaignExecutor:
             if state in ("FINISHED", "CANCELED"):
                 self.progress_monitor.on_recipe_run_completed(run_id, state)
                 break
-            await asyncio.sleep(5)
+            delay = _next_poll_delay(delay, state != previous_state)
+            previous_state = state
+            await asyncio.sleep(delay)
 
         repositories_with_results = await self.client.query_recipe_run_results_repositories(run_id)
         return RecipeExecutionResult(run_id=run_id, repositories=repositories_with_results)
@@ -64,6 +79,7 @@ class CampaignExecutor:
         return commit_id
 
     async def await_pull_request(self, commit_id: str):
+        delay = _POLL_INITIAL_DELAY
         while True:
             job_state = await self.client.query_commit_job_status(commit_id)
             state = job_state["state"]
@@ -71,7 +87,9 @@ class CampaignExecutor:
             if state != "RUNNING":
                 self.progress_monitor.on_pull_request_generation_completed(commit_id, state)
                 break
-            await asyncio.sleep(5)
+            # The job is only polled while it's RUNNING, so there's no state change to start over on
+            delay = _next_poll_delay(delay)
+            await asyncio.sleep(delay)
 
 
 @dataclass(frozen=True)
@@ -1,167 +1,72 @@
 import argparse
 import asyncio
-import base64
-import json
 import re
 import sys
-from dataclasses import dataclass
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
 
-try:
-    from isodate import parse_duration
-    from rich.align import Align
-    from rich.console import Console, Group
-    from rich.emoji import Emoji
-    from rich.layout import Layout
-    from rich.live import Live
-    from rich.markup import escape
-    from rich.markdown import Markdown
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich.text import Text
-    from rich.tree import Tree
-    from rich_argparse import RichHelpFormatter
-except ImportError as e:
-    sys.stderr.write('It seems omega-moderne-client is not installed with cli option. \n'
-                     'Run `pip install "omega-moderne-client[cli]"` to fix this.')
-    sys.exit(1)
-
-from omega_moderne_client.campaign.campaign import Campaign
-from omega_moderne_client.campaign.campaign_executor import CampaignExecutor, PrintingCampaignExecutorProgressMonitor
-from omega_moderne_client.client.gpg_key_config import GpgKeyConfig
-from omega_moderne_client.client.moderne_client import ModerneClient
-from omega_moderne_client.client.client_types import RecipeRunSummary, Repository, RepositoryInput
-from omega_moderne_client.repository_filter import Filter, FilterDetailedReason, FilterReason, \
-    FilteredRecipeExecutionResult
-from omega_moderne_client.util import verbose_timedelta, headers
-
-console = Console()
-HEADER = headers.HEADER_NORMAL
-layout = Layout()
-layout.split(
-    Layout(name='header', size=17),
-    Layout(name='body', ratio=1),
-)
-layout["body"].split(Layout(name='top', size=6), Layout(name='bottom', ratio=1))
-
-
-@dataclass(frozen=True)
-class ConsolePrintingCampaignExecutorProgressMonitor(PrintingCampaignExecutorProgressMonitor):
-
-    @staticmethod
-    def _generate_recipe_overview_table(totals: Dict[str, Any]) -> Table:
-        table = Table()
-        table.add_column('Repositories Searched', justify='right')
-        table.add_column('Repositories Changed', justify='right')
-        table.add_column('Files Searched', justify='right')
-        table.add_column('Files Changed', justify='right')
-        table.add_column('Total Results', justify='right')
-        table.add_column('Total Time Savings', justify='right')
-        table.add_row(
-            str(totals['totalRepositoriesWithErrors'] +
-                totals['totalRepositoriesSuccessful'] +
-                totals['totalRepositoriesWithNoChanges'] +
-                totals['totalRepositoriesWithResults']),
-            str(totals['totalRepositoriesWithResults']),
-            str(totals['totalFilesSearched']),
-            str(totals['totalFilesChanged']),
-            str(totals['totalResults']),
-            verbose_timedelta(parse_duration(totals['totalTimeSavings']))
+from omega_moderne_client.client.client_types import RepositoryInput
+
+if TYPE_CHECKING:
+    from omega_moderne_client.campaign.campaign import Campaign
+    from omega_moderne_client.campaign.campaign_executor import CampaignExecutor, RecipeExecutionResult
+    from omega_moderne_client.client.gpg_key_config import GpgKeyConfig
+    from omega_moderne_client.repository_filter import FilteredRecipeExecutionResult
+
+# The rendering (rich), Moderne API (gql) and campaign (yaml, liquid) stacks are only imported by the functions that
+# need them, so that building the argument parser, and rendering `--help`, stays fast.
+# pylint: disable=import-outside-toplevel
+
+
+class _LazyChoices:
+    """Argparse `choices` whose values are only loaded once argparse actually needs them."""
+
+    def __init__(self, loader: Callable[[], List[str]]):
+        self._loader = loader
+        self._choices: Optional[List[str]] = None
+
+    def _get(self) -> List[str]:
+        if self._choices is None:
+            self._choices = self._loader()
+        return self._choices
+
+    def __contains__(self, item) -> bool:
+        return item in self._get()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get())
+
+
+_REPOSITORY_PATTERN = re.compile(r'^(?P<origin>[^/]+)/(?P<owner>[^/]+)/(?P<repo>[^@]+)(@(?P<branch>.+))?$')
+
+
+def create_repository_input(arg_value) -> RepositoryInput:
+    match = _REPOSITORY_PATTERN.match(arg_value)
+    if not match:
+        raise argparse.ArgumentTypeError(
+            f"Invalid Repository Filter {arg_value}."
+            " Must be of format `origin/owner/repo[@branch]`"
         )
-        return table
-
-    def _generate_recipe_repositories_table(
-            self,
-            run_id: str,
-            repository_run_summaries: List['RecipeRunSummary']
-    ) -> Table:
-        table = Table()
-        table.add_column('Status')
-        table.add_column('Organization')
-        table.add_column('Repository')
-        table.add_column('Branch')
-        table.add_column('Total Results', justify='right')
-        table.add_column('Files Searched', justify='right')
-        table.add_column('Recipe Run', justify='right')
-
-        for summary in repository_run_summaries:
-            if summary.totalChanged == 0 and summary.state == 'FINISHED':
-                continue
-            repository: Repository = summary.repository
-            organization = repository.path.split('/')[0]
-            repository_name = repository.path.split('/')[1]
-            repository_name_cell = repository_name
-            if summary.totalChanged != 0:
-                base64_repository_json = \
-                    base64.b64encode(json.dumps(repository._asdict()).encode('utf-8')).decode('utf-8')
-                link = f"https://{self.domain}/results/{run_id}/details/{base64_repository_json}"
-                repository_name_cell = f"[blue][link={link}]{repository_name}[/link]"
-            table.add_row(
-                self._color_state(summary.state),
-                organization,
-                repository_name_cell,
-                repository.branch,
-                str(summary.totalChanged),
-                str(summary.totalSearched),
-                verbose_timedelta(parse_duration(summary.performance.recipeRun))
-            )
-        return table
-
-    @staticmethod
-    def _color_state(state: str) -> str:
-        # ["CANCELED", "CREATED", "ERROR", "FINISHED", "LOADING", "QUEUED", "RUNNING", "UNAVAILABLE"]
-        if state == 'FINISHED':
-            return f'[green]{state}[/green]'
-        if state == 'ERROR':
-            return f'[red]{state}[/red]'
-        if state in ['CREATED', 'QUEUED', 'RUNNING', 'LOADING']:
-            return f'[yellow]{state}[/yellow]'
-        if state in ['CANCELED', 'UNAVAILABLE']:
-            return f'[grey]{state}[/grey]'
-        return state
-
-    def on_recipe_progress(
-            self,
-            run_id: str,
-            state: str,
-            totals: Dict[str, Any],
-            repository_run_summaries: List['RecipeRunSummary']
-    ) -> None:
-        console.log(escape(f'[{run_id}] {state}'))
-        layout["top"].update(Align.center(
-            self._generate_recipe_overview_table(totals),
-            vertical="middle"
-        ))
-        layout["bottom"].update(Align.center(
-            self._generate_recipe_repositories_table(run_id, repository_run_summaries),
-            vertical="top"
-        ))
-
-    def print(self, *args):
-        console.log(*(escape(arg) if isinstance(arg, str) else arg for arg in args))
-
-
-def print_recipe_filter_reason(filtered_repositories: Dict[Repository, List[FilterDetailedReason]]):
-    if not filtered_repositories:
-        return
-    root = Tree("Filtered repositories", style="bold red")
-    reverse_reason_map: Dict[FilterReason, Tree] = {}
-    for repository, reasons in filtered_repositories.items():
-        # console.print(f"Repository {repository} was filtered out because:")
-        for reason in reasons:
-            # console.print(f"  - {reason.reason}: {reason.details}")
-            if reason.reason not in reverse_reason_map:
-                reverse_reason_map[reason.reason] = root.add(reason.reason.name, style="bold red")
-            reverse_reason_map[reason.reason].add(f"{repository} ({reason.details})")
-    console.print(root)
+    return RepositoryInput(
+        origin=match.group('origin'),
+        path=match.group('owner') + '/' + match.group('repo'),
+        branch=match.group('branch') or 'main'
+    )
+
+
+def _list_campaigns() -> List[str]:
+    from omega_moderne_client.campaign.campaign import Campaign
+    return Campaign.list_campaigns()
 
 
 async def create_pull_request_for_recipe_results(
-        gpg_key_config: GpgKeyConfig,
-        campaign: Campaign,
-        executor: CampaignExecutor,
-        filtered_recipe_execution_result: FilteredRecipeExecutionResult
+        gpg_key_config: 'GpgKeyConfig',
+        campaign: 'Campaign',
+        executor: 'CampaignExecutor',
+        filtered_recipe_execution_result: 'FilteredRecipeExecutionResult'
 ):
+    from omega_moderne_client.cli_console import console
+    from omega_moderne_client.client.gpg_key_config import GpgKeyConfig
+
     if not isinstance(gpg_key_config, GpgKeyConfig):
         raise ValueError("GPG key config must be provided to create pull requests")
     console.print(f"Forking and creating pull requests for campaign {campaign.name}...")
@@ -173,7 +78,25 @@ async def create_pull_request_for_recipe_results(
     await executor.await_pull_request(commit_id=commit_id)
 
 
+async def filter_recipe_results(
+        recipe_execution_result: 'RecipeExecutionResult'
+) -> 'FilteredRecipeExecutionResult':
+    """Filter the repositories of a recipe run, and display the ones that were filtered out."""
+    from omega_moderne_client.cli_console import print_recipe_filter_reason
+    from omega_moderne_client.repository_filter import Filter
+
+    filtered_recipe_execution_result = await Filter.create_all().filter_repositories_async(recipe_execution_result)
+    print_recipe_filter_reason(filtered_recipe_execution_result.filtered_repositories)
+    return filtered_recipe_execution_result
+
+
 async def run_recipe_maybe_generate_prs(args):
+    from omega_moderne_client.campaign.campaign import Campaign
+    from omega_moderne_client.campaign.campaign_executor import CampaignExecutor
+    from omega_moderne_client.cli_console import console, ConsolePrintingCampaignExecutorProgressMonitor
+    from omega_moderne_client.client.gpg_key_config import GpgKeyConfig
+    from omega_moderne_client.client.moderne_client import ModerneClient
+
     if args.generate_prs:
         gpg_key_config = GpgKeyConfig.load_from_env()
         console.print("Generate prs enabled. Pull requests will be created!")
@@ -198,9 +121,7 @@ async def run_recipe_maybe_generate_prs(args):
             )
         recipe_execution_result = await executor.await_recipe(run_id=run_id)
 
-        repository_filter = Filter.create_all()
-        filtered_recipe_execution_result = repository_filter.filter_repositories(recipe_execution_result)
-        print_recipe_filter_reason(filtered_recipe_execution_result.filtered_repositories)
+        filtered_recipe_execution_result = await filter_recipe_results(recipe_execution_result)
 
         if not args.generate_prs:
             console.print("Generate prs not enabled. Complete!")
@@ -215,6 +136,12 @@ async def run_recipe_maybe_generate_prs(args):
 
 
 async def recipe_attach(args):
+    from omega_moderne_client.campaign.campaign import Campaign
+    from omega_moderne_client.campaign.campaign_executor import CampaignExecutor
+    from omega_moderne_client.cli_console import console, ConsolePrintingCampaignExecutorProgressMonitor
+    from omega_moderne_client.client.gpg_key_config import GpgKeyConfig
+    from omega_moderne_client.client.moderne_client import ModerneClient
+
     if args.generate_prs:
         gpg_key_config = GpgKeyConfig.load_from_env()
     else:
@@ -224,10 +151,7 @@ async def recipe_attach(args):
         console.print(f"View live on Moderne https://{client.domain}/results/{args.run_id}")
         executor = CampaignExecutor(client, ConsolePrintingCampaignExecutorProgressMonitor(client.domain))
         recipe_execution_result = await executor.await_recipe(args.run_id)
-        # Display the filtered repositories
-        repository_filter = Filter.create_all()
-        filtered_recipe_execution_result = repository_filter.filter_repositories(recipe_execution_result)
-        print_recipe_filter_reason(filtered_recipe_execution_result.filtered_repositories)
+        filtered_recipe_execution_result = await filter_recipe_results(recipe_execution_result)
 
         if not args.generate_prs:
             console.print("Generate prs not enabled. Complete!")
@@ -244,12 +168,25 @@ async def recipe_attach(args):
 
 
 async def pr_attach(args):
+    from omega_moderne_client.campaign.campaign_executor import CampaignExecutor
+    from omega_moderne_client.cli_console import ConsolePrintingCampaignExecutorProgressMonitor
+    from omega_moderne_client.client.moderne_client import ModerneClient
+
     async with ModerneClient.load_from_env(args.moderne_domain) as client:
         executor = CampaignExecutor(client, ConsolePrintingCampaignExecutorProgressMonitor(client.domain))
         await executor.await_pull_request(args.commit_id)
 
 
 async def print_campaign(args):
+    from rich.console import Group
+    from rich.emoji import Emoji
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.tree import Tree
+
+    from omega_moderne_client.campaign.campaign import Campaign
+    from omega_moderne_client.cli_console import console
+
     def bright_white(string: str) -> str:
         return f"[bright_white]{string}[/bright_white]"
 
@@ -282,150 +219,164 @@ async def print_campaign(args):
     console.print(root)
 
 
-def cli():
-    console.print(HEADER, justify="center")
-    parser = argparse.ArgumentParser(
-        description='Run a campaign to fix security vulnerabilities using Moderne.',
-        formatter_class=RichHelpFormatter
+def _add_campaign_id_argument(
+        subparser: argparse.ArgumentParser,
+        campaign_choices: _LazyChoices,
+        help_text: str = 'The campaign to to run.'
+):
+    # An explicit metavar keeps argparse from iterating the choices while the parser is being built
+    subparser.add_argument(
+        'campaign_id',
+        type=str,
+        metavar='campaign_id',
+        choices=campaign_choices,
+        help=help_text + ' One of: %(choices)s.'
     )
-    parent = argparse.ArgumentParser(add_help=False, formatter_class=RichHelpFormatter)
-    parent.add_argument(
-        '--moderne-domain',
+
+
+def _add_recipe_args(subparser: argparse.ArgumentParser, campaign_choices: _LazyChoices):
+    from rich.markup import escape
+
+    _add_campaign_id_argument(subparser, campaign_choices)
+    group = subparser.add_mutually_exclusive_group()
+    group.add_argument(
+        '--moderne-organization',
         type=str,
-        default='app.moderne.io',
-        help='The Moderne SaaS domain to communicate with. Defaults to `app.moderne.io`.'
+        default='Default',
+        help='The Moderne SaaS organization ID to run the campaign under. Defaults to `Default`.'
     )
+    group.add_argument(
+        '--repository-filter',
+        type=create_repository_input,
+        action='append',
+        help='Filter repositories to run the campaign against. ' +
+             escape('Must be of format `origin/owner/repo[@branch]`. ') +
+             'For example: `github.com/openrewrite/rewrite`. '
+             'If a branch is not specified, `main` is used. '
+             'Can be specified multiple times.'
+    )
+    subparser.set_defaults(func=run_recipe_maybe_generate_prs)
 
-    subparsers = parser.add_subparsers(title="actions")
 
-    pattern = re.compile(r'^(?P<origin>[^/]+)/(?P<owner>[^/]+)/(?P<repo>[^@]+)(@(?P<branch>.+))?$')
+def _configure_run_recipe(subparser: argparse.ArgumentParser, campaign_choices: _LazyChoices):
+    subparser.set_defaults(generate_prs=False)
+    _add_recipe_args(subparser, campaign_choices)
 
-    def create_repository_input(arg_value) -> RepositoryInput:
-        match = pattern.match(arg_value)
-        if not match:
-            raise argparse.ArgumentTypeError(
-                f"Invalid Repository Filter {arg_value}."
-                " Must be of format `origin/owner/repo[@branch]`"
-            )
-        return RepositoryInput(
-            origin=match.group('origin'),
-            path=match.group('owner') + '/' + match.group('repo'),
-            branch=match.group('branch') or 'main'
-        )
 
-    def add_campaign_id_argument(subparser):
-        subparser.add_argument(
-            'campaign_id',
-            type=str,
-            choices=Campaign.list_campaigns(),
-            help='The campaign to to run.'
-        )
+def _configure_run_pull_requests(subparser: argparse.ArgumentParser, campaign_choices: _LazyChoices):
+    subparser.set_defaults(generate_prs=True)
+    _add_recipe_args(subparser, campaign_choices)
 
-    def add_recipe_args(subparser):
-        add_campaign_id_argument(subparser)
-        group = subparser.add_mutually_exclusive_group()
-        group.add_argument(
-            '--moderne-organization',
-            type=str,
-            default='Default',
-            help='The Moderne SaaS organization ID to run the campaign under. Defaults to `Default`.'
-        )
-        group.add_argument(
-            '--repository-filter',
-            type=create_repository_input,
-            action='append',
-            help='Filter repositories to run the campaign against. ' +
-                 escape('Must be of format `origin/owner/repo[@branch]`. ') +
-                 'For example: `github.com/openrewrite/rewrite`. '
-                 'If a branch is not specified, `main` is used. '
-                 'Can be specified multiple times.'
-        )
-        subparser.set_defaults(func=run_recipe_maybe_generate_prs)
 
-    run_recipe_parser = subparsers.add_parser(
-        'run-recipe',
-        help='Run a recipe without creating pull requests.',
-        formatter_class=RichHelpFormatter,
-        parents=[parent],
-    )
-    run_recipe_parser.set_defaults(generate_prs=False)
-    run_prs_parser = subparsers.add_parser(
-        'run-pull-requests',
-        help='Run a recipe and create pull requests.',
-        formatter_class=RichHelpFormatter,
-        parents=[parent],
-    )
-    run_prs_parser.set_defaults(generate_prs=True)
-    add_recipe_args(run_recipe_parser)
-    add_recipe_args(run_prs_parser)
-
-    recipe_attach_parser = subparsers.add_parser(
-        'recipe-attach',
-        help='Attach to a running recipe execution.',
-        formatter_class=RichHelpFormatter,
-        parents=[parent],
-    )
-    recipe_attach_parser.add_argument(
+def _configure_recipe_attach(subparser: argparse.ArgumentParser, _campaign_choices: Optional[_LazyChoices] = None):
+    subparser.add_argument(
         'run_id',
         type=str,
         help='The Moderne recipe execution id run to attach to.'
     )
-    recipe_attach_parser.set_defaults(func=recipe_attach)
+    subparser.set_defaults(func=recipe_attach)
 
-    recipe_attach_and_pull_request_parser = subparsers.add_parser(
-        'recipe-attach-and-run-pull-request',
-        help='Attach to a running recipe execution, then generate pull requests from it.',
-        formatter_class=RichHelpFormatter,
-        parents=[parent],
-    )
-    add_campaign_id_argument(recipe_attach_and_pull_request_parser)
-    recipe_attach_and_pull_request_parser.add_argument(
-        'run_id',
-        type=str,
-        help='The Moderne recipe execution id run to attach to.'
-    )
-    recipe_attach_and_pull_request_parser.set_defaults(generate_prs=True)
-    recipe_attach_and_pull_request_parser.set_defaults(func=recipe_attach)
-
-    pr_attach_parser = subparsers.add_parser(
-        'pr-attach',
-        help='Attach to a running pull request execution.',
-        formatter_class=RichHelpFormatter,
-        parents=[parent],
-    )
-    pr_attach_parser.add_argument(
+
+def _configure_recipe_attach_and_run_pull_request(subparser: argparse.ArgumentParser, campaign_choices: _LazyChoices):
+    _add_campaign_id_argument(subparser, campaign_choices)
+    _configure_recipe_attach(subparser)
+    subparser.set_defaults(generate_prs=True)
+
+
+def _configure_pr_attach(subparser: argparse.ArgumentParser, _campaign_choices: _LazyChoices):
+    subparser.add_argument(
         'commit_id',
         type=str,
         help='The Moderne commit id to attach to.'
     )
-    pr_attach_parser.set_defaults(func=pr_attach)
+    subparser.set_defaults(func=pr_attach)
+
 
-    campaign_printer_parser = subparsers.add_parser(
-        'campaign',
-        help='Print data about a campaign.',
-        formatter_class=RichHelpFormatter,
-        parents=[parent],
+def _configure_campaign(subparser: argparse.ArgumentParser, campaign_choices: _LazyChoices):
+    _add_campaign_id_argument(subparser, campaign_choices, help_text='The campaign to to print.')
+    subparser.set_defaults(func=print_campaign)
+    subparser.set_defaults(not_live=True)
+
+
+_ACTIONS = (
+    ('run-recipe', 'Run a recipe without creating pull requests.', _configure_run_recipe),
+    ('run-pull-requests', 'Run a recipe and create pull requests.', _configure_run_pull_requests),
+    ('recipe-attach', 'Attach to a running recipe execution.', _configure_recipe_attach),
+    (
+        'recipe-attach-and-run-pull-request',
+        'Attach to a running recipe execution, then generate pull requests from it.',
+        _configure_recipe_attach_and_run_pull_request
+    ),
+    ('pr-attach', 'Attach to a running pull request execution.', _configure_pr_attach),
+    ('campaign', 'Print data about a campaign.', _configure_campaign),
+)
+
+
+def create_parser(action: Optional[str] = None) -> argparse.ArgumentParser:
+    """Create the CLI argument parser.
+
+    :param action: The action about to be parsed, if known. When it names a known action, only that action's
+        sub-parser is built. Otherwise, all of them are, so that help and usage errors list every action.
+    """
+    try:
+        from rich_argparse import RichHelpFormatter
+    except ImportError:
+        sys.stderr.write('It seems omega-moderne-client is not installed with cli option. \n'
+                         'Run `pip install "omega-moderne-client[cli]"` to fix this.')
+        sys.exit(1)
+
+    parser = argparse.ArgumentParser(
+        description='Run a campaign to fix security vulnerabilities using Moderne.',
+        formatter_class=RichHelpFormatter
     )
-    campaign_printer_parser.add_argument(
-        'campaign_id',
+    parent = argparse.ArgumentParser(add_help=False, formatter_class=RichHelpFormatter)
+    parent.add_argument(
+        '--moderne-domain',
         type=str,
-        choices=Campaign.list_campaigns(),
-        help='The campaign to to print.'
+        default='app.moderne.io',
+        help='The Moderne SaaS domain to communicate with. Defaults to `app.moderne.io`.'
     )
-    campaign_printer_parser.set_defaults(func=print_campaign)
-    campaign_printer_parser.set_defaults(not_live=True)
 
+    subparsers = parser.add_subparsers(title="actions")
+    campaign_choices = _LazyChoices(_list_campaigns)
+
+    # When the action being run is already known, only its sub-parser needs to be built
+    build_all = action not in (name for name, _, _ in _ACTIONS)
+    for name, help_text, configure in _ACTIONS:
+        if build_all or name == action:
+            configure(
+                subparsers.add_parser(
+                    name,
+                    help=help_text,
+                    formatter_class=RichHelpFormatter,
+                    parents=[parent],
+                ),
+                campaign_choices
+            )
+    return parser
+
+
+def cli():
+    # `--help` and usage errors exit from within `parse_args`, before the console and live layout are ever created
+    parser = create_parser(sys.argv[1] if len(sys.argv) > 1 else None)
     args = parser.parse_args()
     if not hasattr(args, 'func'):
         parser.print_help()
         sys.exit(1)
 
+    from omega_moderne_client.cli_console import console, HEADER, layout, live
+
+    console.print(HEADER, justify="center")
+
     try:
         if hasattr(args, 'not_live') and args.not_live:
             asyncio.run(args.func(args))
         else:
-            with Live(layout, console=console, redirect_stderr=False, refresh_per_second=1):
-                layout["header"].update(Align.center(Text(HEADER, justify="center"), vertical="middle"))
+            from rich.align import Align
+            from rich.text import Text
+
+            layout["header"].update(Align.center(Text(HEADER, justify="center"), vertical="middle"))
+            with live:
                 asyncio.run(args.func(args))
     except KeyboardInterrupt:
         console.print("Interrupted by user. Exiting...")
@@ -0,0 +1,176 @@
+"""Rich based console rendering used by the CLI while it is attached to a recipe run or commit job."""
+import base64
+import functools
+import json
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Tuple
+
+try:
+    from isodate import parse_duration
+    from rich.align import Align
+    from rich.console import Console
+    from rich.layout import Layout
+    from rich.live import Live
+    from rich.markup import escape
+    from rich.table import Table
+    from rich.tree import Tree
+except ImportError as e:
+    sys.stderr.write('It seems omega-moderne-client is not installed with cli option. \n'
+                     'Run `pip install "omega-moderne-client[cli]"` to fix this.')
+    sys.exit(1)
+
+from omega_moderne_client.campaign.campaign_executor import PrintingCampaignExecutorProgressMonitor
+from omega_moderne_client.client.client_types import RecipeRunSummary, Repository
+from omega_moderne_client.repository_filter import FilterDetailedReason, FilterReason
+from omega_moderne_client.util import verbose_timedelta, headers
+
+console = Console()
+HEADER = headers.HEADER_NORMAL
+layout = Layout()
+layout.split(
+    Layout(name='header', size=17),
+    Layout(name='body', ratio=1),
+)
+layout["body"].split(Layout(name='top', size=6), Layout(name='bottom', ratio=1))
+# The layout only changes when a progress update arrives, so it is refreshed on demand instead of on a timer
+live = Live(layout, console=console, redirect_stderr=False, auto_refresh=False)
+
+# ["CANCELED", "CREATED", "ERROR", "FINISHED", "LOADING", "QUEUED", "RUNNING", "UNAVAILABLE"]
+_STATE_MARKUP = {
+    'FINISHED': '[green]FINISHED[/green]',
+    'ERROR': '[red]ERROR[/red]',
+    'CREATED': '[yellow]CREATED[/yellow]',
+    'QUEUED': '[yellow]QUEUED[/yellow]',
+    'RUNNING': '[yellow]RUNNING[/yellow]',
+    'LOADING': '[yellow]LOADING[/yellow]',
+    'CANCELED': '[grey]CANCELED[/grey]',
+    'UNAVAILABLE': '[grey]UNAVAILABLE[/grey]',
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_duration(iso_duration: str) -> str:
+    """Format an ISO 8601 duration, memoized as the same durations are rendered again on every progress tick."""
+    return verbose_timedelta(parse_duration(iso_duration))
+
+
+@functools.lru_cache(maxsize=8192)
+def _repository_results_link(domain: str, run_id: str, repository: Repository) -> str:
+    """Link to the results of a repository in a recipe run, memoized as it never changes for the same inputs."""
+    base64_repository_json = base64.b64encode(json.dumps(repository._asdict()).encode('utf-8')).decode('ascii')
+    return f"https://{domain}/results/{run_id}/details/{base64_repository_json}"
+
+
+@dataclass(frozen=True)
+class ConsolePrintingCampaignExecutorProgressMonitor(PrintingCampaignExecutorProgressMonitor):
+    _row_cache: Dict[Tuple[str, Repository], Tuple[tuple, Tuple[str, ...]]] = \
+        field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @staticmethod
+    def _generate_recipe_overview_table(totals: Dict[str, Any]) -> Table:
+        table = Table()
+        table.add_column('Repositories Searched', justify='right')
+        table.add_column('Repositories Changed', justify='right')
+        table.add_column('Files Searched', justify='right')
+        table.add_column('Files Changed', justify='right')
+        table.add_column('Total Results', justify='right')
+        table.add_column('Total Time Savings', justify='right')
+        table.add_row(
+            str(totals['totalRepositoriesWithErrors'] +
+                totals['totalRepositoriesSuccessful'] +
+                totals['totalRepositoriesWithNoChanges'] +
+                totals['totalRepositoriesWithResults']),
+            str(totals['totalRepositoriesWithResults']),
+            str(totals['totalFilesSearched']),
+            str(totals['totalFilesChanged']),
+            str(totals['totalResults']),
+            _fmt_duration(totals['totalTimeSavings'])
+        )
+        return table
+
+    def _generate_recipe_repositories_table(
+            self,
+            run_id: str,
+            repository_run_summaries: List['RecipeRunSummary']
+    ) -> Table:
+        table = Table()
+        table.add_column('Status')
+        table.add_column('Organization')
+        table.add_column('Repository')
+        table.add_column('Branch')
+        table.add_column('Total Results', justify='right')
+        table.add_column('Files Searched', justify='right')
+        table.add_column('Recipe Run', justify='right')
+
+        row_cache = self._row_cache
+        add_row = table.add_row
+        visible_summaries = [
+            summary for summary in repository_run_summaries
+            if not (summary.totalChanged == 0 and summary.state == 'FINISHED')
+        ]
+        for summary in visible_summaries:
+            # Only re-render the cells of a row when the repository's summary has actually changed
+            key = (run_id, summary.repository)
+            fingerprint = (summary.state, summary.totalChanged, summary.totalSearched, summary.performance.recipeRun)
+            cached = row_cache.get(key)
+            if cached is None or cached[0] != fingerprint:
+                cached = (fingerprint, self._generate_recipe_repository_row(run_id, summary))
+                row_cache[key] = cached
+            add_row(*cached[1])
+        return table
+
+    def _generate_recipe_repository_row(self, run_id: str, summary: 'RecipeRunSummary') -> Tuple[str, ...]:
+        repository: Repository = summary.repository
+        organization, _, repository_name = repository.path.partition('/')
+        repository_name_cell = repository_name
+        if summary.totalChanged != 0:
+            link = _repository_results_link(self.domain, run_id, repository)
+            repository_name_cell = f"[blue][link={link}]{repository_name}[/link]"
+        return (
+            _STATE_MARKUP.get(summary.state, summary.state),
+            organization,
+            repository_name_cell,
+            repository.branch,
+            str(summary.totalChanged),
+            str(summary.totalSearched),
+            _fmt_duration(summary.performance.recipeRun)
+        )
+
+    def on_recipe_progress(
+            self,
+            run_id: str,
+            state: str,
+            totals: Dict[str, Any],
+            repository_run_summaries: List['RecipeRunSummary']
+    ) -> None:
+        console.log(escape(f'[{run_id}] {state}'))
+        layout["top"].update(Align.center(
+            self._generate_recipe_overview_table(totals),
+            vertical="middle"
+        ))
+        layout["bottom"].update(Align.center(
+            self._generate_recipe_repositories_table(run_id, repository_run_summaries),
+            vertical="top"
+        ))
+        live.refresh()
+
+    def print(self, *args):
+        console.log(*[escape(arg) if isinstance(arg, str) else arg for arg in args])
+
+
+def print_recipe_filter_reason(filtered_repositories: Dict[Repository, List[FilterDetailedReason]]):
+    if not filtered_repositories:
+        return
+    # Group the repositories by reason first, so each reason's subtree is created once
+    grouped_by_reason: Dict[FilterReason, List[str]] = defaultdict(list)
+    for repository, reasons in filtered_repositories.items():
+        for reason in reasons:
+            grouped_by_reason[reason.reason].append(f"{repository} ({reason.details})")
+    root = Tree("Filtered repositories", style="bold red")
+    for reason, entries in grouped_by_reason.items():
+        reason_tree = root.add(reason.name, style="bold red")
+        for entry in entries:
+            reason_tree.add(entry)
+    console.print(root)
@@ -1,6 +1,8 @@
+import functools
 import os
 from dataclasses import dataclass
-from typing import List
+
+_ENV_VAR_NAMES = ("GPG_KEY_PASSPHRASE", "GPG_KEY_PRIVATE_KEY", "GPG_KEY_PUBLIC_KEY")
 
 
 @dataclass(frozen=True)
@@ -9,30 +11,25 @@ class GpgKeyConfig:
     key_private_key: str
     key_public_key: str
 
-    @classmethod
-    def load_from_env(cls) -> 'GpgKeyConfig':
-        env_vars = cls._load_env_variables(
-            "GPG_KEY_PASSPHRASE",
-            "GPG_KEY_PRIVATE_KEY",
-            "GPG_KEY_PUBLIC_KEY"
-        )
-        return GpgKeyConfig(
-            key_passphrase=env_vars[0],
-            key_private_key=env_vars[1],
-            key_public_key=env_vars[2]
-        )
+    @functools.cached_property
+    def private_key_pem(self) -> str:
+        """The private key, with escaped newlines (as found in environment variables) restored."""
+        return self.key_private_key.replace("\\n", "\n")
 
-    @staticmethod
-    def _load_env_variables(*env_names: str) -> List[str]:
-        missing_env_var_names = []
-        present_env_vars = []
-        for env_name in env_names:
-            value = os.getenv(env_name)
-            if not value:
-                missing_env_var_names.append(env_name)
-            else:
-                present_env_vars.append(value)
+    @functools.cached_property
+    def public_key_pem(self) -> str:
+        """The public key, with escaped newlines (as found in environment variables) restored."""
+        return self.key_public_key.replace("\\n", "\n")
 
+    @classmethod
+    def load_from_env(cls) -> 'GpgKeyConfig':
+        env = os.environ
+        missing_env_var_names = [env_name for env_name in _ENV_VAR_NAMES if not env.get(env_name)]
         if missing_env_var_names:
             raise ValueError(f"Environment variables {missing_env_var_names} are not set")
-        return present_env_vars
+        key_passphrase, key_private_key, key_public_key = (env[env_name] for env_name in _ENV_VAR_NAMES)
+        return GpgKeyConfig(
+            key_passphrase=key_passphrase,
+            key_private_key=key_private_key,
+            key_public_key=key_public_key
+        )
@@ -1,30 +1,171 @@
 import abc
 import asyncio
-import base64
+import functools
+import inspect
 import logging
 import os
-import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 from types import TracebackType
-from typing import List, Any, Dict, Optional, TypeVar, Generic, cast, Union, Type
+from typing import List, Any, Dict, Optional, TypeVar, Generic, cast, Union, Type, AsyncIterator, ClassVar
 from uuid import uuid1, UUID
 
 from gql import gql, Client
 from gql.client import AsyncClientSession
 from gql.transport.aiohttp import AIOHTTPTransport
-from graphql import DocumentNode, ExecutionResult, GraphQLSchema
+from graphql import DocumentNode, ExecutionResult, GraphQLSchema, print_schema
 
 from .client_types import RecipeRunSummary, Repository, Commit, RecipeRunPerformance, RecipeRun, RecipeRunHistory, \
     Recipe, RepositoryInput
 from ..campaign.campaign import Campaign
 from ..client.gpg_key_config import GpgKeyConfig
 
+try:
+    import orjson  # pytype: disable=import-error
+except ImportError:
+    orjson = None
+
 __all__ = ["ModerneClient"]
 
 DEFAULT_DOMAIN = "app.moderne.io"
 
 
+def _json_transport_args() -> Dict[str, Any]:
+    """
+    Use `orjson`, when it is installed, to encode requests and (with `gql` versions that support it) decode responses.
+    """
+    if orjson is None:
+        return {}
+    args: Dict[str, Any] = {"json_serialize": lambda obj: orjson.dumps(obj).decode('utf-8')}
+    if "json_deserialize" in inspect.signature(AIOHTTPTransport.__init__).parameters:
+        args["json_deserialize"] = orjson.loads
+    return args
+
+
+@functools.lru_cache(maxsize=1)
+def _load_api_token() -> str:
+    """
+    Load the Moderne API token, once per process.
+
+    The `MODERNE_API_TOKEN` environment variable takes precedence, so the file system is only touched without it.
+    """
+    env_token = os.getenv("MODERNE_API_TOKEN")
+    if env_token:
+        return env_token
+    token_file = Path.home().joinpath('.moderne/token.txt')
+    try:
+        read_token = token_file.read_text(encoding='utf-8').strip()
+    except FileNotFoundError as error:
+        raise ValueError(
+            "No token file found at `~/.moderne/token.txt` and " +
+            "`MODERNE_API_TOKEN` environment variable is not set!"
+        ) from error
+    if not read_token:
+        raise ValueError(f"Token file {token_file} is empty")
+    return read_token
+
+
+@functools.lru_cache(maxsize=1)
+def _print_schema(schema: GraphQLSchema) -> str:
+    """The schema doesn't change once loaded, so it's only printed once."""
+    return print_schema(schema)
+
+
+# GraphQL documents are parsed once, when the module is imported, rather than on every call
+_RUN_ORGANIZATION_CAMPAIGN_QUERY = gql(
+    # language=GraphQL
+    """
+    mutation runSecurityFix($organizationId: ID, $yaml: Base64!, $priority: RecipeRunPriority) {
+      runYamlRecipe(organizationId: $organizationId, yaml: $yaml, priority: $priority) {
+        id
+        start
+      }
+    }
+    """
+)
+
+_RUN_CUSTOM_FILTER_CAMPAIGN_QUERY = gql(
+    # language=GraphQL
+    """
+    mutation runSecurityFix(
+        $repositoryFilter: [RepositoryInput!],
+        $yaml: Base64!,
+        $priority: RecipeRunPriority
+    ) {
+      runYamlRecipe(repositoryFilter: $repositoryFilter, yaml: $yaml, priority: $priority) {
+        id
+        start
+      }
+    }
+    """
+)
+
+_RECIPE_RUN_STATUS_QUERY = gql(
+    # language=GraphQL
+    """
+    query getRecipeRun($id: ID!) {
+        recipeRun(id: $id) {
+            id
+            state
+            totals {
+                totalFilesChanged
+                totalFilesSearched
+                totalRepositoriesSuccessful
+                totalRepositoriesWithErrors
+                totalRepositoriesWithResults
+                totalRepositoriesWithNoChanges
+                totalResults
+                totalTimeSavings
+            }
+        }
+    }
+    """
+)
+
+_FORK_AND_PULL_REQUEST_QUERY = gql(
+    # language=GraphQL
+    """
+    mutation forkAndPullRequest(
+      $commit: CommitInput!,
+      $organization: String!,
+      $pullRequestBody:Base64!,
+      $pullRequestTitle:String!
+    ) {
+        forkAndPullRequest(
+            commit: $commit,
+            draft: false,
+            maintainerCanModify: true,
+            organization: $organization,
+            pullRequestBody: $pullRequestBody,
+            pullRequestTitle: $pullRequestTitle,
+            shouldPrefixOrganizationName: true
+        ) {
+            id
+        }
+    }
+    """
+)
+
+_COMMIT_JOB_SUMMARY_QUERY = gql(
+    # language=GraphQL
+    """
+    query getCommitJob($id: ID!) {
+        commitJob(id: $id) {
+            id
+            state
+            completed
+            summaryResults {
+                count
+                failedCount
+                noChangeCount
+                successfulCount
+            }
+        }
+    }
+    """
+)
+
+
 class ClientWrapper(abc.ABC):
     @abc.abstractmethod
     async def connect(self) -> None:
@@ -52,25 +193,27 @@ class ModerneClient:
     domain: str
     _client: ClientWrapper
 
+    # The paged queries hold no state besides the client, so a single instance of each is shared by every call
+
+    @functools.cached_property
+    def _recipe_run_history_query(self) -> "GetAllRecipeRunHistory":
+        return GetAllRecipeRunHistory(self._client)
+
+    @functools.cached_property
+    def _recipe_run_summary_results_query(self) -> "GetRecipeRunSummaryResults":
+        return GetRecipeRunSummaryResults(self._client)
+
+    @functools.cached_property
+    def _recipe_run_repositories_query(self) -> "GetRecipeRunRepositories":
+        return GetRecipeRunRepositories(self._client)
+
+    @functools.cached_property
+    def _commit_job_commits_query(self) -> "GetCommitJobCommits":
+        return GetCommitJobCommits(self._client)
+
     @classmethod
     def load_from_env(cls, domain: str = DEFAULT_DOMAIN) -> "ModerneClient":
-        token_file = Path.home().joinpath('.moderne/token.txt')
-        api_token: str
-        if token_file.exists():
-            with open(token_file, 'r', encoding='utf-8') as file:
-                read_token = file.read().strip()
-            if not read_token:
-                raise ValueError(f"Token file {token_file} is empty")
-            api_token = read_token
-        else:
-            read_token = os.getenv("MODERNE_API_TOKEN")
-            if not read_token:
-                raise ValueError(
-                    "No token file found at `~/.moderne/token.txt` and " +
-                    "`MODERNE_API_TOKEN` environment variable is not set!"
-                )
-            api_token = read_token
-        return cls.create(api_token, domain=domain)
+        return cls.create(_load_api_token(), domain=domain)
 
     @staticmethod
     def create(moderne_api_token: str, domain: str = DEFAULT_DOMAIN) -> "ModerneClient":
@@ -83,17 +226,32 @@ class ModerneClient:
                 headers={
                     "Authorization": f'Bearer {moderne_api_token}'
                 },
-                timeout=timeout
+                timeout=timeout,
+                **_json_transport_args()
             ),
             fetch_schema_from_transport=True,
             execute_timeout=timeout,
             parse_results=True
         )
+        # The documents are parsed once, at import time, so each of them only needs to be validated once too
+        validate = client.validate
+        validated_documents: Dict[int, DocumentNode] = {}
+
+        def validate_once(request: Any) -> None:
+            # gql 3 validates the document itself, gql 4 a request wrapping it
+            document = getattr(request, "document", request)
+            if id(document) not in validated_documents:
+                validate(request)
+                # Keep a reference to the document, so its id can't be reused by another one
+                validated_documents[id(document)] = document
+
+        client.validate = validate_once
 
         class ModerneClientWrapper(ClientWrapper):
             session: AsyncClientSession = None
 
             async def connect(self) -> None:
+                # The aiohttp session, and its pool of keep-alive connections, lives as long as the gql session
                 self.session = await client.connect_async(reconnecting=True, retry_execute=False)
 
             async def execute(
@@ -101,20 +259,21 @@ class ModerneClient:
                     document: DocumentNode,
                     variable_values: Optional[Dict[str, Any]] = None,
             ) -> Union[Dict[str, Any], ExecutionResult]:
-                start = time.time()
                 if self.session is None:
                     raise ValueError("Client is not connected! Did you use `async with` to wrap the ModerneClient?")
                 try:
                     return await self.session.execute(document, variable_values=variable_values)
                 except asyncio.exceptions.TimeoutError as error:
-                    end = time.time()
                     raise asyncio.exceptions.TimeoutError(
-                        f"The Moderne API timed out after {end - start} seconds. Please try again later."
+                        f"The Moderne API timed out after {timeout} seconds. Please try again later."
                     ) from error
 
             async def get_schema(self) -> GraphQLSchema:
-                # Run a query to force the schema to get loaded
-                await self.execute(gql("{ __schema { types { name } } }"))
+                # The schema is fetched when connecting, only fetch it here if that didn't happen
+                if client.schema is None:
+                    if self.session is None:
+                        raise ValueError("Client is not connected! Did you use `async with` to wrap the ModerneClient?")
+                    await self.session.fetch_schema()
                 return client.schema
 
             async def close(self) -> None:
@@ -162,17 +321,6 @@ class ModerneClient:
         # `previousRecipeRuns` API endpoint to search for our `uuid` and get the run ID,
         # once the run has actually started.
         uuid = uuid1()
-        run_fix_query = gql(
-            # language=GraphQL
-            """
-            mutation runSecurityFix($organizationId: ID, $yaml: Base64!, $priority: RecipeRunPriority) {
-              runYamlRecipe(organizationId: $organizationId, yaml: $yaml, priority: $priority) {
-                id
-                start
-              }
-            }
-            """
-        )
 
         params = {
             "organizationId": target_organization_id,
@@ -181,7 +329,7 @@ class ModerneClient:
         }
         # Execute the query on the transport
         try:
-            result = await self._client.execute(run_fix_query, variable_values=params)
+            result = await self._client.execute(_RUN_ORGANIZATION_CAMPAIGN_QUERY, variable_values=params)
             return result["runYamlRecipe"]["id"]
         except asyncio.exceptions.TimeoutError as error:
             logging.warning(
@@ -192,24 +340,36 @@ class ModerneClient:
             except ValueError as value_error:
                 raise value_error from error
 
-    async def _find_recipe_run_with_uuid(self, uuid: UUID) -> RecipeRunHistory:
-        total_attempts = 20
-        for attempt in range(0, total_attempts):
+    async def _find_recipe_run_with_uuid(self, uuid: UUID, timeout: float = 200) -> RecipeRunHistory:
+        """
+        Poll the recipe run history until the run with `uuid` in its recipe id shows up.
+
+        :param timeout: The number of seconds to keep polling for.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        attempt = 0
+        while True:
+            attempt += 1
             try:
-                run_history = await GetAllRecipeRunHistory(self._client).get_first_page()
+                run_history = await self._recipe_run_history_query.get_first_page()
             except asyncio.exceptions.TimeoutError:
                 run_history = []
             for run in run_history:
                 if str(uuid) in run.recipeRun.recipe.id:
                     return run
+            # Back off exponentially, the run usually shows up within seconds of the gateway timing out
+            delay = min(30.0, 1.5 ** attempt)
+            if loop.time() + delay > deadline:
+                break
             logging.warning(
-                "Attempt[%s/%s]: Could not find recipe run with uuid %s. Trying again in 5 seconds.",
-                attempt + 1,
-                total_attempts,
-                uuid
+                "Attempt[%s]: Could not find recipe run with uuid %s. Trying again in %.1f seconds.",
+                attempt,
+                uuid,
+                delay
             )
-            await asyncio.sleep(10)
-        raise ValueError(f"Could not find recipe run with uuid {uuid} after {total_attempts} attempts.")
+            await asyncio.sleep(delay)
+        raise ValueError(f"Could not find recipe run with uuid {uuid} after {attempt} attempts.")
 
     async def run_custom_filter_campaign(
             self,
@@ -217,53 +377,19 @@ class ModerneClient:
             repository_filter: List[RepositoryInput],
             priority: str = "LOW"
     ) -> str:
-        run_fix_query = gql(
-            # language=GraphQL
-            """
-            mutation runSecurityFix(
-                $repositoryFilter: [RepositoryInput!],
-                $yaml: Base64!,
-                $priority: RecipeRunPriority
-            ) {
-              runYamlRecipe(repositoryFilter: $repositoryFilter, yaml: $yaml, priority: $priority) {
-                id
-                start
-              }
-            }
-            """
-        )
         params = {
-            "repositoryFilter": [f._asdict() for f in repository_filter],
+            "repositoryFilter": [
+                {"origin": f.origin, "path": f.path, "branch": f.branch} for f in repository_filter
+            ],
             "yaml": campaign.get_recipe_yaml_base_64(uuid1()),
             "priority": priority
         }
-        result = await self._client.execute(run_fix_query, variable_values=params)
+        result = await self._client.execute(_RUN_CUSTOM_FILTER_CAMPAIGN_QUERY, variable_values=params)
         return result["runYamlRecipe"]["id"]
 
     async def query_recipe_run_status(self, recipe_run_id: str) -> Dict[str, Any]:
-        recipe_run_results = gql(
-            # language=GraphQL
-            """
-            query getRecipeRun($id: ID!) {
-                recipeRun(id: $id) {
-                    id
-                    state
-                    totals {
-                        totalFilesChanged
-                        totalFilesSearched
-                        totalRepositoriesSuccessful
-                        totalRepositoriesWithErrors
-                        totalRepositoriesWithResults
-                        totalRepositoriesWithNoChanges
-                        totalResults
-                        totalTimeSavings
-                    }
-                }
-            }
-            """
-        )
         params = {"id": recipe_run_id}
-        result = await self._client.execute(recipe_run_results, variable_values=params)
+        result = await self._client.execute(_RECIPE_RUN_STATUS_QUERY, variable_values=params)
         return result["recipeRun"]
 
     async def query_recipe_run(
@@ -271,28 +397,22 @@ class ModerneClient:
             recipe_run_id: str,
             filter_by: Optional[Dict[str, Any]] = None
     ) -> List['RecipeRunSummary']:
-        return await GetRecipeRunSummaryResults(self._client).get_all(recipe_run_id, filter_by=filter_by)
+        return await self._recipe_run_summary_results_query.get_all(recipe_run_id, filter_by=filter_by)
 
     async def query_recipe_run_sorted_by_results(self, recipe_run_id: str) -> List['RecipeRunSummary']:
-        all_finished, unfinished = await asyncio.gather(
-            GetRecipeRunSummaryResults(self._client).get_all(
-                recipe_run_id,
-                filter_by={'statuses': ['FINISHED'], 'onlyWithResults': True},
-                order_by={'direction': 'DESC', 'field': 'TOTAL_RESULTS'}
-            ),
-            GetRecipeRunSummaryResults(self._client).get_first_page(
-                recipe_run_id,
-                filter_by={'statuses': ['ERROR', 'LOADING', 'QUEUED', 'RUNNING', 'CREATED', 'UNAVAILABLE']},
-            )
+        return await self._recipe_run_summary_results_query.get_all_and_first_page(
+            recipe_run_id,
+            filter_by={'statuses': ['FINISHED'], 'onlyWithResults': True},
+            order_by={'direction': 'DESC', 'field': 'TOTAL_RESULTS'},
+            first_page_filter_by={'statuses': ['ERROR', 'LOADING', 'QUEUED', 'RUNNING', 'CREATED', 'UNAVAILABLE']}
         )
-        return all_finished + unfinished
 
     async def query_recipe_run_repositories(
             self,
             recipe_run_id: str,
             filter_by: Optional[Dict[str, Any]] = None
     ) -> List['Repository']:
-        return [summary.repository for summary in await self.query_recipe_run(recipe_run_id, filter_by)]
+        return await self._recipe_run_repositories_query.get_all(recipe_run_id, filter_by)
 
     async def query_recipe_run_results_repositories(self, recipe_run_id: str) -> List['Repository']:
         return await self.query_recipe_run_repositories(
@@ -306,89 +426,48 @@ class ModerneClient:
             gpg_key_config: GpgKeyConfig,
             repositories: List[Repository]
     ) -> str:
-        fork_and_pull_request_query = gql(
-            # language=GraphQL
-            """
-            mutation forkAndPullRequest(
-              $commit: CommitInput!,
-              $organization: String!,
-              $pullRequestBody:Base64!,
-              $pullRequestTitle:String!
-            ) {
-                forkAndPullRequest(
-                    commit: $commit,
-                    draft: false,
-                    maintainerCanModify: true,
-                    organization: $organization,
-                    pullRequestBody: $pullRequestBody,
-                    pullRequestTitle: $pullRequestTitle,
-                    shouldPrefixOrganizationName: true
-                ) {
-                    id
-                }
-            }
-            """
-        )
 
         params = {
             "commit": {
                 "branchName": campaign.branch,
                 "gpgKey": {
                     "passphrase": gpg_key_config.key_passphrase,
-                    "privateKey": gpg_key_config.key_private_key.replace("\\n", "\n"),
-                    "publicKey": gpg_key_config.key_public_key.replace("\\n", "\n")
+                    "privateKey": gpg_key_config.private_key_pem,
+                    "publicKey": gpg_key_config.public_key_pem
                 },
                 "message": campaign.commit_title,
-                "extendedMessage": base64.b64encode(campaign.commit_extended.encode()).decode(),
+                "extendedMessage": campaign.commit_extended_base_64,
                 "recipeRunId": recipe_id,
-                "repositories": [r._asdict() for r in repositories]
+                "repositories": [{"origin": r.origin, "path": r.path, "branch": r.branch} for r in repositories]
             },
             "organization": "BulkSecurityGeneratorProjectV2",  # TODO: Make this configurable
             "pullRequestTitle": campaign.pr_title,
-            "pullRequestBody": base64.b64encode(campaign.pr_body.encode()).decode()
+            "pullRequestBody": campaign.pr_body_base_64
         }
-        result = await self._client.execute(fork_and_pull_request_query, variable_values=params)
+        result = await self._client.execute(_FORK_AND_PULL_REQUEST_QUERY, variable_values=params)
         return result["forkAndPullRequest"]["id"]
 
     async def query_commit_job_commits(self, commit_job_id: str) -> List[Commit]:
-        return await GetCommitJobCommits(self._client).call(commit_job_id)
+        return await self._commit_job_commits_query.call(commit_job_id)
 
     async def query_commit_job_with_summary(self, commit_job_id: str) -> Dict[str, Any]:
-        commit_job_summary_query = gql(
-            # language=GraphQL
-            """
-            query getCommitJob($id: ID!) {
-                commitJob(id: $id) {
-                    id
-                    state
-                    completed
-                    summaryResults {
-                        count
-                        failedCount
-                        noChangeCount
-                        successfulCount
-                    }
-                }
-            }
-            """
-        )
         params = {"id": commit_job_id}
         result = await self._client.execute(
-            commit_job_summary_query,
+            _COMMIT_JOB_SUMMARY_QUERY,
             variable_values=params
         )
         return result["commitJob"]
 
     async def query_commit_job_status(self, commit_job_id: str) -> Dict[str, Any]:
-        results: List[Commit] = await self.query_commit_job_commits(commit_job_id)
-        commit_job = await self.query_commit_job_with_summary(commit_job_id)
+        commit_job = await self._commit_job_commits_query.get_commit_job(commit_job_id)
+        results: List[Commit] = commit_job["commits"]
         summary_results = commit_job["summaryResults"]
         state: str
         if "state" in commit_job:
-            # Not currently supported, but hopefully will be in the future.
+            # Always selected by the query, so the fallback below, from before the state was supported, isn't reached.
             # https://linuxfoundation.slack.com/archives/C04HR6EJ38D/p1678137720981939
             state = commit_job["state"]
-        elif "CANCELED" in (node.state for node in results):
+        elif any(commit.state == "CANCELED" for commit in results):
             # TODO: This is a hack, we should be able to get the state from the commit job
             state = "CANCELED"
         elif summary_results["count"] == commit_job["completed"]:
@@ -399,14 +478,11 @@ class ModerneClient:
         else:
             state = "COMPLETED"
 
-        commit_job["commits"] = results
         commit_job["state"] = state
         return commit_job
 
     async def schema(self) -> str:
-        # noinspection PyPackageRequirements
-        from graphql import print_schema  # pylint: disable=import-outside-toplevel
-        return print_schema(await self._client.get_schema())
+        return _print_schema(await self._client.get_schema())
 
 
 T = TypeVar('T')
@@ -415,7 +491,7 @@ T = TypeVar('T')
 @dataclass(frozen=True)
 class PagedQuery(abc.ABC, Generic[T]):
     client: ClientWrapper
-    query: DocumentNode
+    query: ClassVar[DocumentNode]
 
     @abc.abstractmethod
     def map_page(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -432,19 +508,29 @@ class PagedQuery(abc.ABC, Generic[T]):
         params.update(kwargs)
         return await self.client.execute(self.query, variable_values=params)
 
-    async def request_all(self, **kwargs) -> List[T]:
+    async def iter_all(self, after: Optional[str] = None, **kwargs) -> AsyncIterator[T]:
         """
-        Take a paged query and return all results.
+        Take a paged query and yield all results, holding only one page of results in memory at a time.
+
+        :param after: The cursor to start after, by default, the first page.
         """
-        next_after = None
-        results: List[T] = []
+        # Built once for the whole sweep, only the cursor changes between pages.
+        # Pages are requested one after the other, so the previous request is done with it when it is updated.
+        params: Dict[str, Any] = {"after": after}
+        params.update(kwargs)
         while True:
-            paged = self.map_page(await self.request_page(next_after, **kwargs))
-            results.extend([self.map_node(edge["node"]) for edge in paged["edges"]])
+            paged = self.map_page(await self.client.execute(self.query, variable_values=params))
+            for edge in paged["edges"]:
+                yield self.map_node(edge["node"])
             if not paged["pageInfo"]["hasNextPage"]:
                 break
-            next_after = paged["pageInfo"]["endCursor"]
-        return results
+            params["after"] = paged["pageInfo"]["endCursor"]
+
+    async def request_all(self, **kwargs) -> List[T]:
+        """
+        Take a paged query and return all results.
+        """
+        return [node async for node in self.iter_all(**kwargs)]
 
     async def get_page_results(self, after: Optional[str], **kwargs) -> List[T]:
         """
@@ -456,7 +542,7 @@ class PagedQuery(abc.ABC, Generic[T]):
 
 @dataclass(frozen=True)
 class GetAllRecipeRunHistory(PagedQuery[RecipeRunHistory]):
-    query: DocumentNode = field(default=gql(
+    query: ClassVar[DocumentNode] = gql(
         # language=GraphQL
         """
         query allRecipeRunHistory($after: String, $sortOrder: SortOrder = DESC, $filterBy: RecipeRunFilterInput) {
@@ -486,13 +572,18 @@ class GetAllRecipeRunHistory(PagedQuery[RecipeRunHistory]):
             }
         }
         """
-    ))
+    )
 
     def map_node(self, node: Dict[str, Any]) -> RecipeRunHistory:
-        node = node.copy()
-        node["recipeRun"]["recipe"] = Recipe(**node["recipeRun"]["recipe"])
-        node["recipeRun"] = RecipeRun(**node["recipeRun"])
-        return RecipeRunHistory(**node)
+        recipe_run = node["recipeRun"]
+        return RecipeRunHistory(
+            recipeRun=RecipeRun(
+                id=recipe_run["id"],
+                recipe=Recipe(**recipe_run["recipe"]),
+                state=recipe_run["state"]
+            ),
+            runId=node["runId"]
+        )
 
     def map_page(self, data: Dict[str, Any]) -> Dict[str, Any]:
         return data["allRecipeRuns"]
@@ -503,7 +594,7 @@ class GetAllRecipeRunHistory(PagedQuery[RecipeRunHistory]):
 
 @dataclass(frozen=True)
 class GetRecipeRunSummaryResults(PagedQuery[RecipeRunSummary]):
-    query: DocumentNode = field(default=gql(
+    query: ClassVar[DocumentNode] = gql(
         # language=GraphQL
         """
         query getRecipeRun(
@@ -546,13 +637,69 @@ class GetRecipeRunSummaryResults(PagedQuery[RecipeRunSummary]):
           }
         }
         """
-    ))
+    )
+
+    all_and_first_page_query: ClassVar[DocumentNode] = gql(
+        # language=GraphQL
+        """
+        query getRecipeRunAllAndFirstPage(
+            $id: ID!,
+            $filterBy: SummaryResultsFilterInput,
+            $orderBy: SummaryResultsOrderInput,
+            $firstPageFilterBy: SummaryResultsFilterInput
+        ) {
+          recipeRun(id: $id) {
+            all: summaryResultsPages(filterBy: $filterBy, orderBy: $orderBy) {
+              ...summaryResultsPage
+            }
+            firstPage: summaryResultsPages(filterBy: $firstPageFilterBy) {
+              ...summaryResultsPage
+            }
+          }
+        }
+
+        fragment summaryResultsPage on RecipeRunSummaryConnection {
+          pageInfo {
+            hasNextPage
+            endCursor
+          }
+          edges {
+            node {
+              debugMarkers
+              errorMarkers
+              infoMarkers
+              warningMarkers
+              timeSavings
+              totalChanged
+              totalSearched
+              state
+              performance {
+                recipeRun
+              }
+              repository {
+                origin
+                path
+                branch
+              }
+            }
+          }
+        }
+        """
+    )
 
     def map_node(self, node: Dict[str, Any]) -> RecipeRunSummary:
-        node = node.copy()
-        node["performance"] = RecipeRunPerformance(**node["performance"])
-        node["repository"] = Repository(**node["repository"])
-        return RecipeRunSummary(**node)
+        return RecipeRunSummary(
+            debugMarkers=node["debugMarkers"],
+            errorMarkers=node["errorMarkers"],
+            infoMarkers=node["infoMarkers"],
+            warningMarkers=node["warningMarkers"],
+            timeSavings=node["timeSavings"],
+            totalChanged=node["totalChanged"],
+            totalSearched=node["totalSearched"],
+            state=node["state"],
+            performance=RecipeRunPerformance(**node["performance"]),
+            repository=Repository(**node["repository"])
+        )
 
     async def get_first_page(
             self,
@@ -560,12 +707,7 @@ class GetRecipeRunSummaryResults(PagedQuery[RecipeRunSummary]):
             filter_by: Optional[Dict[str, Any]] = None,
             order_by: Optional[Dict[str, Any]] = None,
     ) -> List[RecipeRunSummary]:
-        args = {"id": recipe_run_id}
-        if filter_by:
-            args["filterBy"] = filter_by
-        if order_by:
-            args["orderBy"] = order_by
-        return await self.get_page_results(None, **args)
+        return await self.get_page_results(None, **self._variables(recipe_run_id, filter_by, order_by))
 
     async def get_all(
             self,
@@ -573,11 +715,95 @@ class GetRecipeRunSummaryResults(PagedQuery[RecipeRunSummary]):
             filter_by: Optional[Dict[str, Any]] = None,
             order_by: Optional[Dict[str, Any]] = None,
     ) -> List[RecipeRunSummary]:
-        args = {"id": recipe_run_id}
+        return await self.request_all(**self._variables(recipe_run_id, filter_by, order_by))
+
+    async def get_all_and_first_page(
+            self,
+            recipe_run_id: str,
+            filter_by: Dict[str, Any],
+            order_by: Dict[str, Any],
+            first_page_filter_by: Dict[str, Any]
+    ) -> List[RecipeRunSummary]:
+        """
+        All the results matching `filter_by`, followed by the first page of results matching `first_page_filter_by`.
+
+        The first page of both is requested in a single document, only the remaining pages of the former take
+        further requests.
+        """
+        recipe_run = (await self.client.execute(
+            self.all_and_first_page_query,
+            variable_values={
+                "id": recipe_run_id,
+                "filterBy": filter_by,
+                "orderBy": order_by,
+                "firstPageFilterBy": first_page_filter_by
+            }
+        ))["recipeRun"]
+        all_paged = recipe_run["all"]
+        results = [self.map_node(edge["node"]) for edge in all_paged["edges"]]
+        if all_paged["pageInfo"]["hasNextPage"]:
+            async for summary in self.iter_all(
+                    all_paged["pageInfo"]["endCursor"],
+                    **self._variables(recipe_run_id, filter_by, order_by)
+            ):
+                results.append(summary)
+        results.extend(self.map_node(edge["node"]) for edge in recipe_run["firstPage"]["edges"])
+        return results
+
+    @staticmethod
+    def _variables(
+            recipe_run_id: str,
+            filter_by: Optional[Dict[str, Any]],
+            order_by: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        args: Dict[str, Any] = {"id": recipe_run_id}
         if filter_by:
             args["filterBy"] = filter_by
         if order_by:
             args["orderBy"] = order_by
+        return args
+
+    def map_page(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return data["recipeRun"]["summaryResultsPages"]
+
+
+@dataclass(frozen=True)
+class GetRecipeRunRepositories(PagedQuery[Repository]):
+    """
+    Like `GetRecipeRunSummaryResults`, but only selects the repositories of the summary results.
+    """
+    query: ClassVar[DocumentNode] = gql(
+        # language=GraphQL
+        """
+        query getRecipeRunRepositories($id: ID!, $after: String, $filterBy: SummaryResultsFilterInput) {
+          recipeRun(id: $id) {
+            summaryResultsPages(after: $after, filterBy: $filterBy) {
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
+              edges {
+                node {
+                  repository {
+                    origin
+                    path
+                    branch
+                  }
+                }
+              }
+            }
+          }
+        }
+        """
+    )
+
+    def map_node(self, node: Dict[str, Any]) -> Repository:
+        return Repository(**node["repository"])
+
+    async def get_all(self, recipe_run_id: str, filter_by: Optional[Dict[str, Any]] = None) -> List[Repository]:
+        args: Dict[str, Any] = {"id": recipe_run_id}
+        if filter_by:
+            args["filterBy"] = filter_by
         return await self.request_all(**args)
 
     def map_page(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -586,12 +812,13 @@ class GetRecipeRunSummaryResults(PagedQuery[RecipeRunSummary]):
 
 @dataclass(frozen=True)
 class GetCommitJobCommits(PagedQuery[Commit]):
-    query: DocumentNode = field(default=gql(
+    query: ClassVar[DocumentNode] = gql(
         # language=GraphQL
         """
         query getCommitJob($id: ID!, $after: String) {
             commitJob(id: $id) {
                 id
+                state
                 completed
                 commits(after: $after) {
                     pageInfo {
@@ -623,16 +850,35 @@ class GetCommitJobCommits(PagedQuery[Commit]):
             }
         }
         """
-    ))
+    )
 
     def map_node(self, node: Dict[str, Any]) -> Commit:
-        node = node.copy()
-        node["repository"] = Repository(**node["repository"])
-        return Commit(**node)
+        return Commit(
+            modified=node["modified"],
+            repository=Repository(**node["repository"]),
+            resultLink=node["resultLink"],
+            state=node["state"],
+            stateMessage=node["stateMessage"]
+        )
 
     async def call(self, commit_job_id: str) -> List[Commit]:
         return await self.request_all(**{"id": commit_job_id})
 
+    async def get_commit_job(self, commit_job_id: str) -> Dict[str, Any]:
+        """
+        Get the commit job, with its summary and all of its commits.
+
+        The summary comes back with the first page of commits, saving a round trip over querying it separately.
+        """
+        commit_job = (await self.request_page(None, id=commit_job_id))["commitJob"]
+        paged = commit_job["commits"]
+        commits = [self.map_node(edge["node"]) for edge in paged["edges"]]
+        if paged["pageInfo"]["hasNextPage"]:
+            async for commit in self.iter_all(paged["pageInfo"]["endCursor"], id=commit_job_id):
+                commits.append(commit)
+        commit_job["commits"] = commits
+        return commit_job
+
     def map_page(self, data: Dict[str, Any]) -> Dict[str, Any]:
         return data["commitJob"]["commits"]
 
@@ -1,5 +1,6 @@
 """Filtering the set of repositories to generate pull requests for."""
 import abc
+import asyncio
 from dataclasses import dataclass
 from typing import List, Dict, Set
 
@@ -10,6 +11,15 @@ from omega_moderne_client.repository_filter.filter_types import FilterDetailedRe
 
 __all__ = ['Filter', 'FilterDetailedReason', 'FilterReason']
 
+# The order a repository's filter reasons are reported in
+_FILTER_REASON_ORDER = {
+    filter_reason: index for index, filter_reason in enumerate((
+        FilterReason.OTHER,
+        FilterReason.TOP_TEN_THOUSAND,
+        FilterReason.GH_ROBOTS_TXT,
+    ))
+}
+
 
 class Filter(abc.ABC):
     """A filter that can be applied to a repository to determine if it should be filtered out."""
@@ -29,14 +39,53 @@ class Filter(abc.ABC):
         :param recipe_execution_result: The recipe execution result to filter.
         :return: The filtered recipe execution result.
         """
-        filtered_repositories: Dict[Repository, List[FilterDetailedReason]] = {}
-        for repository in recipe_execution_result.repositories:
-            filter_reasons = self.should_filter_repository(repository)
-            if filter_reasons:
-                filtered_repositories[repository] = filter_reasons
+        return self._filtered_result(
+            recipe_execution_result,
+            [self.should_filter_repository(repository) for repository in recipe_execution_result.repositories]
+        )
+
+    async def filter_repositories_async(
+            self,
+            recipe_execution_result: RecipeExecutionResult,
+            concurrency: int = 20
+    ) -> FilteredRecipeExecutionResult:
+        """Filter the repositories in the given recipe execution result, checking several repositories at once.
+
+        Filters may make a network request per repository, so the checks run in worker threads to overlap them.
+
+        :param recipe_execution_result: The recipe execution result to filter.
+        :param concurrency: The maximum number of repositories to check at once.
+        :return: The filtered recipe execution result.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def should_filter_repository(repository: 'Repository') -> List[FilterDetailedReason]:
+            async with semaphore:
+                return await asyncio.to_thread(self.should_filter_repository, repository)
+
+        return self._filtered_result(
+            recipe_execution_result,
+            await asyncio.gather(
+                *[should_filter_repository(repository) for repository in recipe_execution_result.repositories]
+            )
+        )
+
+    @staticmethod
+    def _filtered_result(
+            recipe_execution_result: RecipeExecutionResult,
+            filter_reasons_per_repository: List[List[FilterDetailedReason]]
+    ) -> FilteredRecipeExecutionResult:
+        filtered_repositories: Dict[Repository, List[FilterDetailedReason]] = {
+            repository: filter_reasons
+            for repository, filter_reasons in zip(recipe_execution_result.repositories, filter_reasons_per_repository)
+            if filter_reasons
+        }
         return FilteredRecipeExecutionResult(
             run_id=recipe_execution_result.run_id,
-            repositories=list(set(recipe_execution_result.repositories) - set(filtered_repositories.keys())),
+            repositories=[
+                repository for repository in recipe_execution_result.repositories
+                if repository not in filtered_repositories
+            ],
             filtered_repositories=filtered_repositories
         )
 
@@ -53,7 +102,15 @@ class Filter(abc.ABC):
         :return: The filter to use.
         """
 
-        filters = [cls._filter_for_filter_reason(filter_reason) for filter_reason in filter_reasons]
+        # A set iterates in a different order in every process, sort it so reasons are reported in a consistent order.
+        # Unknown reasons go last, for `_filter_for_filter_reason` to reject.
+        filters = [
+            cls._filter_for_filter_reason(filter_reason)
+            for filter_reason in sorted(
+                filter_reasons,
+                key=lambda reason: _FILTER_REASON_ORDER.get(reason, len(_FILTER_REASON_ORDER))
+            )
+        ]
         return CombinedFilter(filters=filters)
 
     @staticmethod
@@ -1,5 +1,6 @@
+import threading
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from urllib.parse import urlparse, urlencode, urlunparse
 from urllib.robotparser import RobotFileParser
 
@@ -9,6 +10,20 @@ from ..client.client_types import Repository
 from . import Filter
 from .filter_types import FilterDetailedReason, FilterReason
 
+_THREAD_LOCAL = threading.local()
+
+
+def _session() -> requests.Session:
+    """The calling thread's session, keeping connections to the GH-ROBOTS.txt host alive between repositories.
+
+    `Filter.filter_repositories_async` checks repositories from several worker threads at once, and
+    `requests.Session` isn't documented as thread-safe, so each thread gets its own.
+    """
+    session = getattr(_THREAD_LOCAL, 'session', None)
+    if session is None:
+        session = _THREAD_LOCAL.session = requests.Session()
+    return session
+
 
 @dataclass(frozen=True)
 class GitHubRobotsTxtFilter(Filter):
@@ -56,7 +71,7 @@ class GitHubRobotsTxtFilter(Filter):
             "https://raw.githubusercontent.com",
             f"/{user}/{repository}/{branch}/.github/GH-ROBOTS.txt"
         )
-        response = requests.get(url, timeout=10)
+        response = _session().get(url, timeout=10)
         if response.status_code == 404:
             return None
         if response.status_code != 200:
@@ -65,9 +80,10 @@ class GitHubRobotsTxtFilter(Filter):
 
     @staticmethod
     def _build_url(base_url, path, args_dict=None) -> str:
+        if not args_dict:
+            # Nothing to encode, so there's no need to take the base URL apart
+            return base_url + path
         # Returns a list in the structure of urlparse.ParseResult
-        if args_dict is None:
-            args_dict = {}
         url_parts = list(urlparse(base_url))
         url_parts[2] = path
         url_parts[4] = urlencode(args_dict)
@@ -80,6 +96,11 @@ class _GitHubRobotFileParser(RobotFileParser):
     def __init__(self, content: str):
         super().__init__()
         self.parse(content.splitlines())
+        # Lowercased once here, rather than on every check against every user agent
+        self._entry_useragents = [
+            tuple(agent.lower() for agent in entry.useragents)
+            for entry in self.entries  # pytype: disable=attribute-error
+        ]
 
     def applies_to(self, useragent: str) -> bool:
         """Determine if the user agent is allowed to access the repository.
@@ -87,26 +108,25 @@ class _GitHubRobotFileParser(RobotFileParser):
         :param useragent: The user agent to check.
         :return: True if the user agent is allowed to access the repository.
         """
-        for entry in self.entries:  # pytype: disable=attribute-error
-            if self._applies_to_entry(useragent, entry):
+        useragent = useragent.lower()
+        for entry_useragents in self._entry_useragents:
+            if self._applies_to_entry(useragent, entry_useragents):
                 return True
         return False
 
     @staticmethod
-    def _applies_to_entry(useragent: str, entry) -> bool:
+    def _applies_to_entry(useragent: str, entry_useragents: Tuple[str, ...]) -> bool:
         """Determine if the user agent is allowed to access the repository.
 
-        :param useragent: The user agent to check.
+        :param useragent: The lowercased user agent to check.
+        :param entry_useragents: The lowercased user agents of the entry.
         :return: True if the user agent is allowed to access the repository.
         """
         # check if this entry applies to the specified agent
-        # split the name token and make it lower case
-        useragent = useragent.lower()
-        for agent in entry.useragents:
+        for agent in entry_useragents:
             if agent == '*':
                 # we have the catch-all agent
                 return True
-            agent = agent.lower()
             if agent in useragent:
                 return True
         return False
@@ -20,7 +20,7 @@ class OtherRepositoryFilter(Filter):
         :param repository: The repository to check.
         :return: The reason for why the repository was filtered out, or an empty list if it should not be filtered out.
         """
-        if repository.as_url() in self.repository_to_reasons:
-            return [FilterDetailedReason(reason=FilterReason.OTHER, details=reason) for reason in
-                    self.repository_to_reasons[repository.as_url()]]
+        reasons = self.repository_to_reasons.get(repository.as_url())
+        if reasons:
+            return [FilterDetailedReason(reason=FilterReason.OTHER, details=reason) for reason in reasons]
         return []
@@ -1,6 +1,7 @@
 import csv
+import functools
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, FrozenSet
 
 import requests
 
@@ -11,24 +12,30 @@ from omega_moderne_client.repository_filter.filter_types import FilterDetailedRe
 
 @dataclass(frozen=True)
 class TopTenThousandProjects(Filter):
-    list: List[Dict[str, str]]
+    urls: FrozenSet[str]
+    """The URLs of the projects, so that each repository is a single lookup."""
 
     def should_filter_repository(self, repository: 'Repository') -> List[FilterDetailedReason]:
-        repository_url = f"https://{repository.origin}/{repository.path}"
-        for project in self.list:
-            if project['URL'] == repository_url:
-                return [FilterDetailedReason(
-                    FilterReason.TOP_TEN_THOUSAND,
-                    'The repository is in the top 10,000 critical OSS projects.'
-                )]
+        if repository.as_url() in self.urls:
+            return [FilterDetailedReason(
+                FilterReason.TOP_TEN_THOUSAND,
+                'The repository is in the top 10,000 critical OSS projects.'
+            )]
         return []
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def load_from_remote() -> 'TopTenThousandProjects':
+        """Download the list of projects, once per process, it's shared by every filter that needs it."""
         # pylint: disable=line-too-long
         csv_url = 'https://docs.google.com/spreadsheets/d/e/2PACX-1vQJjUIa78qOs19mmZ2AmpehplONAsnAsAoji-oQcd8phurjEyoG6_BgPeTgCYzAtEzgkC_W6Bx2LZOD/pub?output=csv'  # noqa
-        response = requests.get(csv_url, timeout=10)
-        response.raise_for_status()
-        # Pre-filter for elements that have a URL
-        top_ten_thousand_csv = [element for element in csv.DictReader(response.text.splitlines()) if element['URL']]
-        return TopTenThousandProjects(top_ten_thousand_csv)
+        with requests.get(csv_url, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            # The published sheet is UTF-8, iter_lines can only decode it with an explicit encoding
+            response.encoding = 'utf-8'
+            # Parse the rows as they are downloaded, only the URL column is kept
+            reader = csv.reader(response.iter_lines(decode_unicode=True))
+            url_index = next(reader).index('URL')
+            # Pre-filter for elements that have a URL
+            urls = frozenset(row[url_index] for row in reader if len(row) > url_index and row[url_index])
+        return TopTenThousandProjects(urls)
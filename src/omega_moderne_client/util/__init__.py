@@ -11,6 +11,8 @@ def verbose_timedelta(delta: timedelta):
     '1 min 30s'
     >>> verbose_timedelta(timedelta(minutes=1, seconds=30, milliseconds=500))
     '1 min 30.5s'
+    >>> verbose_timedelta(timedelta(minutes=1, milliseconds=500))
+    '1 min 0.5s'
     >>> verbose_timedelta(timedelta())
     ''
     """
@@ -23,13 +25,5 @@ def verbose_timedelta(delta: timedelta):
         s = round(s + ms / 1000, 2)
     labels = [' day', ' hr', ' min', 's']
     dhms = [f'{i}{lbl}{"s" if i != 1 and lbl != "s" else ""}' for i, lbl in zip([d, h, m, s], labels) if i != 0]
-    if len(dhms) == 0:
-        return ''
-    # pylint: disable-next=consider-using-enumerate
-    for start in range(len(dhms)):
-        if not dhms[start].startswith('0'):
-            break
-    for end in range(len(dhms) - 1, -1, -1):
-        if not dhms[end].startswith('0'):
-            break
-    return ' '.join(dhms[start:end + 1])
+    # Zero components are already left out, so there is nothing left to trim
+    return ' '.join(dhms)
@@ -1,21 +1,27 @@
 import asyncio
+import base64
 import re
+import uuid
 
 import aiohttp
 import markdown
+import yaml
 from aiounittest.case import AsyncTestCase
 
 from omega_moderne_client.campaign.campaign import Campaign
 
 
+_HREF_PATTERN = re.compile(r'href=[\'"]?([^\'" >]+)')
+
+
 def get_links_from_markdown(markdown_content: str) -> set[str]:
     html = markdown.markdown(markdown_content)
-    links = list(set(re.findall(r'href=[\'"]?([^\'" >]+)', html)))
-    return set(filter(lambda l: l[0] != "{" and 'mailto:' not in l, links))
+    return {link for link in _HREF_PATTERN.findall(html) if link[0] != "{" and 'mailto:' not in link}
 
 
 class CachingLinkChecker:
     _headers = {'User-Agent': 'Mozilla/5.0'}
+    _head_unsupported_statuses = (403, 405, 501)
 
     def __init__(self):
         self.session = None
@@ -44,8 +50,15 @@ class CachingLinkChecker:
         if not self.session:
             raise RuntimeError("Must enter context manager before checking links!")
         async with self.session.head(link, allow_redirects=True, headers=self._headers, timeout=10) as resp:
-            self.cache[link] = resp.status
-            return resp.status
+            status = resp.status
+        if status in self._head_unsupported_statuses:
+            # Some servers refuse HEAD requests, ask for the first byte of the page instead
+            headers = {**self._headers, 'Range': 'bytes=0-0'}
+            async with self.session.get(link, allow_redirects=True, headers=headers, timeout=10) as resp:
+                # A server honouring the range answers with partial content
+                status = 200 if resp.status == 206 else resp.status
+        self.cache[link] = status
+        return status
 
 
 class TestCampaign(AsyncTestCase):
@@ -64,6 +77,21 @@ class TestCampaign(AsyncTestCase):
             for campaign in campaigns:
                 await self.assert_campaign(campaign)
 
+    def test_base_64_fields_round_trip(self):
+        campaign = Campaign.load('http_in_gradle_build')
+        assert base64.b64decode(campaign.commit_extended_base_64).decode('utf-8') == campaign.commit_extended
+        assert base64.b64decode(campaign.pr_body_base_64).decode('utf-8') == campaign.pr_body
+        pr_body_base_64 = campaign.pr_body_base_64
+        assert campaign.pr_body_base_64 is pr_body_base_64
+
+    def test_recipe_yaml(self):
+        campaign = Campaign.load('http_in_gradle_build')
+        run_uuid = uuid.uuid1()
+        recipe = yaml.safe_load(campaign.get_recipe_yaml(run_uuid))
+        assert str(run_uuid) in recipe['name']
+        assert recipe['recipeList'] == [campaign.recipe_id]
+        assert recipe['applicability']['anySource'][-1] == campaign.recipe_id
+
     async def assert_campaign(self, campaign: Campaign):
         self.assert_string_field_is_sane('name', campaign.name)
         self.assert_string_field_is_sane('branch', campaign.branch)
@@ -5,7 +5,7 @@ from omega_moderne_client.repository_filter.top_ten_thousand import TopTenThousa
 
 def test_load_top_ten_thousand():
     top_ten_thousand = TopTenThousandProjects.load_from_remote()
-    assert len(top_ten_thousand.list) >= 5_000
+    assert len(top_ten_thousand.urls) >= 5_000
     omega_filter_details = top_ten_thousand.should_filter_repository(
         Repository(**{'origin': 'github.com', 'path': 'ossf/omega-moderne-client', 'branch': 'main'})
     )
@@ -0,0 +1,44 @@
+import argparse
+from unittest import mock
+
+import pytest
+
+from omega_moderne_client import cli
+from omega_moderne_client.client.client_types import RepositoryInput
+
+
+def test_campaign_choices_are_loaded_lazily():
+    with mock.patch.object(cli, '_list_campaigns', return_value=['zip_slip']) as list_campaigns:
+        parser = cli.create_parser()
+        list_campaigns.assert_not_called()
+        parser.parse_args(['recipe-attach', 'run_id'])
+        list_campaigns.assert_not_called()
+
+        args = parser.parse_args(['campaign', 'zip_slip'])
+        assert args.campaign_id == 'zip_slip'
+        list_campaigns.assert_called_once()
+
+
+def test_unknown_campaign_is_rejected():
+    with mock.patch.object(cli, '_list_campaigns', return_value=['zip_slip']):
+        parser = cli.create_parser()
+        with pytest.raises(SystemExit):
+            parser.parse_args(['campaign', 'not_a_campaign'])
+
+
+def test_only_the_requested_action_is_built():
+    parser = cli.create_parser('pr-attach')
+    args = parser.parse_args(['pr-attach', 'commit_id'])
+    assert args.commit_id == 'commit_id'
+    assert args.func is cli.pr_attach
+    with pytest.raises(SystemExit):
+        parser.parse_args(['recipe-attach', 'run_id'])
+
+
+def test_create_repository_input():
+    assert cli.create_repository_input('github.com/ossf/omega-moderne-client') == \
+        RepositoryInput(origin='github.com', path='ossf/omega-moderne-client', branch='main')
+    assert cli.create_repository_input('github.com/ossf/omega-moderne-client@develop') == \
+        RepositoryInput(origin='github.com', path='ossf/omega-moderne-client', branch='develop')
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli.create_repository_input('ossf/omega-moderne-client')